@@ -11,127 +11,134 @@ Public surface layout (this package root only — not ``internal`` / ``cli``):
 - :mod:`archivey.exceptions` — error hierarchy
 - :mod:`archivey.measurement` — optional I/O counters
 
-Names in ``__all__`` are the documented API. A few advanced types are also imported
+Names in ``__all__`` are the documented API. A few advanced types are also exported
 here (so ``from archivey import …`` keeps working) but omitted from ``__all__`` so
 they do not crowd the generated API reference — see the ``# noqa: F401`` imports.
+
+Exports are resolved lazily (PEP 562): each name is bound from its submodule on first
+use, and ``__version__`` only pays for ``importlib.metadata`` when read. Backends
+still self-register when ``archivey`` imports (``backend-registry`` spec), so the
+registry is complete without a prior ``open_archive()``. The ``TYPE_CHECKING`` imports
+below are the static view of the same table; keep the two in sync
+(``tests/test_public_api`` checks every lazy name resolves). This module's own imports
+are underscore-aliased so they stay out of the public namespace.
 """
 
-from importlib.metadata import PackageNotFoundError, version
-
-try:
-    __version__ = version("archivey")
-except PackageNotFoundError:
-    __version__ = "0.0.0+unknown"
-
-from archivey.config import (
-    DEFAULT_ARCHIVEY_CONFIG,
-    RAPIDGZIP_AUTO_MIN_COMPRESSED_SIZE,  # noqa: F401 — advanced; not in __all__
-    AcceleratorMode,
-    ArchiveyConfig,
-    ExtractionLimits,
-    ListingLimits,
-    PasswordInput,
-    PasswordProvider,
-    PasswordRequest,
-)
-from archivey.core import (
-    DetectionConfidence,
-    FormatAvailability,
-    FormatInfo,
-    FormatSupport,
-    MissingComponent,
-    detect_format,
-    extract,
-    format_availability,
-    list_known_formats,
-    list_supported_formats,
-    open_archive,
-    open_stream,
-)
-from archivey.cost import (
-    AccessCost,
-    CostReceipt,
-    ListingCost,
-    StreamCapability,
-)
-from archivey.diagnostics import (
-    # Context payloads: importable for isinstance/match; omitted from __all__.
-    ArchiveEofContext,  # noqa: F401
-    Diagnostic,
-    DiagnosticCode,
-    DiagnosticContext,
-    DiagnosticDisposition,
-    DiagnosticPolicy,
-    DiagnosticSeverity,
-    DiagnosticSummary,
-    DigestContext,  # noqa: F401
-    ExtractionOutcomeContext,  # noqa: F401
-    ExtractionReport,
-    FormatConflictContext,  # noqa: F401
-    MemberListReport,
-    MemberTimestampContext,  # noqa: F401
-    NameCollisionContext,  # noqa: F401
-    NameEncodingContext,  # noqa: F401
-    NameNormalizationContext,  # noqa: F401
-    NameSanitizedContext,  # noqa: F401
-    OnDiagnostic,
-    ScanRaceContext,  # noqa: F401
-    SeekIndexContext,  # noqa: F401
-    StreamRewindContext,  # noqa: F401
-    SymlinkTargetContext,  # noqa: F401
-)
-from archivey.exceptions import (
-    ArchiveyError,
-    ArchiveyUsageError,
-    ConcurrentAccessError,
-    CorruptionError,
-    DiagnosticRaisedError,
-    EncryptionError,
-    ExtractionError,
-    FilterRejectionError,
-    FormatDetectionError,
-    LinkTargetNotFoundError,
-    OpenError,
-    PackageNotInstalledError,
-    PathTraversalError,
-    ReadError,
-    ResourceLimitError,
-    SpecialFileError,
-    StreamNotSeekableError,
-    SymlinkEscapeError,
-    TruncatedError,
-    UnportableNameError,
-    UnsupportedFeatureError,
-    UnsupportedFormatError,
-    UnsupportedOperationError,
-    WriteError,  # noqa: F401 — write API not shipped yet; kept importable
-)
-from archivey.internal.extraction_types import (
-    ExtractionPolicy,
-    ExtractionProgress,
-    ExtractionResult,
-    ExtractionStatus,
-    MemberFilter,
-    OnError,
-    OverwritePolicy,
-)
-from archivey.internal.streams.archive_stream import ArchiveStream
-from archivey.measurement import IoStats, enable_measurement
-from archivey.reader import ArchiveReader, MemberSelector
-from archivey.types import (
-    ArchiveFormat,
-    ArchiveInfo,
-    ArchiveMember,
-    CompressionAlgorithm,
-    CompressionMethod,
-    ContainerFormat,
-    CreateSystem,
-    HashAlgorithm,
-    MemberStreams,
-    MemberType,
-    StreamFormat,
-    crc32_digest,
-)
+import importlib as _importlib
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    from archivey.config import (
+        DEFAULT_ARCHIVEY_CONFIG,
+        RAPIDGZIP_AUTO_MIN_COMPRESSED_SIZE,  # noqa: F401 — advanced; not in __all__
+        AcceleratorMode,
+        ArchiveyConfig,
+        ExtractionLimits,
+        ListingLimits,
+        PasswordInput,
+        PasswordProvider,
+        PasswordRequest,
+    )
+    from archivey.core import (
+        DetectionConfidence,
+        FormatAvailability,
+        FormatInfo,
+        FormatSupport,
+        MissingComponent,
+        detect_format,
+        extract,
+        format_availability,
+        list_known_formats,
+        list_supported_formats,
+        open_archive,
+        open_stream,
+    )
+    from archivey.cost import (
+        AccessCost,
+        CostReceipt,
+        ListingCost,
+        StreamCapability,
+    )
+    from archivey.diagnostics import (
+        # Context payloads: importable for isinstance/match; omitted from __all__.
+        ArchiveEofContext,  # noqa: F401
+        Diagnostic,
+        DiagnosticCode,
+        DiagnosticContext,
+        DiagnosticDisposition,
+        DiagnosticPolicy,
+        DiagnosticSeverity,
+        DiagnosticSummary,
+        DigestContext,  # noqa: F401
+        ExtractionOutcomeContext,  # noqa: F401
+        ExtractionReport,
+        FormatConflictContext,  # noqa: F401
+        MemberListReport,
+        MemberTimestampContext,  # noqa: F401
+        NameCollisionContext,  # noqa: F401
+        NameEncodingContext,  # noqa: F401
+        NameNormalizationContext,  # noqa: F401
+        NameSanitizedContext,  # noqa: F401
+        OnDiagnostic,
+        ScanRaceContext,  # noqa: F401
+        SeekIndexContext,  # noqa: F401
+        StreamRewindContext,  # noqa: F401
+        SymlinkTargetContext,  # noqa: F401
+    )
+    from archivey.exceptions import (
+        ArchiveyError,
+        ArchiveyUsageError,
+        ConcurrentAccessError,
+        CorruptionError,
+        DiagnosticRaisedError,
+        EncryptionError,
+        ExtractionError,
+        FilterRejectionError,
+        FormatDetectionError,
+        LinkTargetNotFoundError,
+        OpenError,
+        PackageNotInstalledError,
+        PathTraversalError,
+        ReadError,
+        ResourceLimitError,
+        SpecialFileError,
+        StreamNotSeekableError,
+        SymlinkEscapeError,
+        TruncatedError,
+        UnportableNameError,
+        UnsupportedFeatureError,
+        UnsupportedFormatError,
+        UnsupportedOperationError,
+        WriteError,  # noqa: F401 — write API not shipped yet; kept importable
+    )
+    from archivey.internal.extraction_types import (
+        ExtractionPolicy,
+        ExtractionProgress,
+        ExtractionResult,
+        ExtractionStatus,
+        MemberFilter,
+        OnError,
+        OverwritePolicy,
+    )
+    from archivey.internal.streams.archive_stream import ArchiveStream
+    from archivey.measurement import IoStats, enable_measurement
+    from archivey.reader import ArchiveReader, MemberSelector
+    from archivey.types import (
+        ArchiveFormat,
+        ArchiveInfo,
+        ArchiveMember,
+        CompressionAlgorithm,
+        CompressionMethod,
+        ContainerFormat,
+        CreateSystem,
+        HashAlgorithm,
+        MemberStreams,
+        MemberType,
+        StreamFormat,
+        crc32_digest,
+    )
+
+    __version__: str
 
 __all__ = [
     "__version__",
@@ -218,9 +225,160 @@ __all__ = [
     "UnsupportedOperationError",
 ]
 
-# Eager backend registration so list_supported_formats / format_availability work
-# immediately after `import archivey` (open_archive also imports as a safety net).
-import archivey.internal.backends  # noqa: E402,F401
+# Submodule -> names re-exported from it, resolved on first attribute access.
+_LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "archivey.config": (
+        "DEFAULT_ARCHIVEY_CONFIG",
+        "RAPIDGZIP_AUTO_MIN_COMPRESSED_SIZE",
+        "AcceleratorMode",
+        "ArchiveyConfig",
+        "ExtractionLimits",
+        "ListingLimits",
+        "PasswordInput",
+        "PasswordProvider",
+        "PasswordRequest",
+    ),
+    "archivey.core": (
+        "DetectionConfidence",
+        "FormatAvailability",
+        "FormatInfo",
+        "FormatSupport",
+        "MissingComponent",
+        "detect_format",
+        "extract",
+        "format_availability",
+        "list_known_formats",
+        "list_supported_formats",
+        "open_archive",
+        "open_stream",
+    ),
+    "archivey.cost": (
+        "AccessCost",
+        "CostReceipt",
+        "ListingCost",
+        "StreamCapability",
+    ),
+    "archivey.diagnostics": (
+        "ArchiveEofContext",
+        "Diagnostic",
+        "DiagnosticCode",
+        "DiagnosticContext",
+        "DiagnosticDisposition",
+        "DiagnosticPolicy",
+        "DiagnosticSeverity",
+        "DiagnosticSummary",
+        "DigestContext",
+        "ExtractionOutcomeContext",
+        "ExtractionReport",
+        "FormatConflictContext",
+        "MemberListReport",
+        "MemberTimestampContext",
+        "NameCollisionContext",
+        "NameEncodingContext",
+        "NameNormalizationContext",
+        "NameSanitizedContext",
+        "OnDiagnostic",
+        "ScanRaceContext",
+        "SeekIndexContext",
+        "StreamRewindContext",
+        "SymlinkTargetContext",
+    ),
+    "archivey.exceptions": (
+        "ArchiveyError",
+        "ArchiveyUsageError",
+        "ConcurrentAccessError",
+        "CorruptionError",
+        "DiagnosticRaisedError",
+        "EncryptionError",
+        "ExtractionError",
+        "FilterRejectionError",
+        "FormatDetectionError",
+        "LinkTargetNotFoundError",
+        "OpenError",
+        "PackageNotInstalledError",
+        "PathTraversalError",
+        "ReadError",
+        "ResourceLimitError",
+        "SpecialFileError",
+        "StreamNotSeekableError",
+        "SymlinkEscapeError",
+        "TruncatedError",
+        "UnportableNameError",
+        "UnsupportedFeatureError",
+        "UnsupportedFormatError",
+        "UnsupportedOperationError",
+        "WriteError",
+    ),
+    "archivey.internal.extraction_types": (
+        "ExtractionPolicy",
+        "ExtractionProgress",
+        "ExtractionResult",
+        "ExtractionStatus",
+        "MemberFilter",
+        "OnError",
+        "OverwritePolicy",
+    ),
+    "archivey.internal.streams.archive_stream": ("ArchiveStream",),
+    "archivey.measurement": (
+        "IoStats",
+        "enable_measurement",
+    ),
+    "archivey.reader": (
+        "ArchiveReader",
+        "MemberSelector",
+    ),
+    "archivey.types": (
+        "ArchiveFormat",
+        "ArchiveInfo",
+        "ArchiveMember",
+        "CompressionAlgorithm",
+        "CompressionMethod",
+        "ContainerFormat",
+        "CreateSystem",
+        "HashAlgorithm",
+        "MemberStreams",
+        "MemberType",
+        "StreamFormat",
+        "crc32_digest",
+    ),
+}
+
+_EXPORT_MODULE: dict[str, str] = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+
+def _package_version() -> str:
+    # importlib.metadata is itself a noticeable import; only pay for it on request.
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("archivey")
+    except PackageNotFoundError:
+        return "0.0.0+unknown"
+
+
+def __getattr__(name: str) -> _typing.Any:
+    if name == "__version__":
+        value: _typing.Any = _package_version()
+    else:
+        module = _EXPORT_MODULE.get(name)
+        if module is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(_importlib.import_module(module), name)
+    # Cache on the package so later lookups never reach __getattr__ again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    # The public view: exports (resolved or not) plus module dunders, not the helpers
+    # this module imports for itself.
+    dunders = {name for name in globals() if name.startswith("__")}
+    return sorted({*dunders, *_EXPORT_MODULE, "__version__"})
+
 
-# Keep importlib.metadata helpers out of the public namespace (__all__ is authoritative).
-del PackageNotFoundError, version
+# Backends self-register at import time (backend-registry spec): list_supported_formats()
+# and the registry work on a bare ``import archivey``. Last, so a backend that reaches
+# back into the package during its import finds ``__getattr__`` already defined.
+_importlib.import_module("archivey.internal.backends")
@@ -437,9 +437,14 @@ def extract(
     Returns an :class:`~archivey.ExtractionReport` whose diagnostic summary spans
     detection, open, and extraction for this call.
     """
-    # Peek only to choose access mode; open_archive re-resolves ``source`` (cheap).
-    peek_target = resolve_source(source).open_source
-    streaming = is_stream(peek_target) and not is_seekable(peek_target)
+    # Peek only to choose access mode; open_archive re-resolves ``source``. A path is
+    # never a non-seekable stream, so skip the peek there: for a volume-shaped name it
+    # would repeat open_archive's sibling scan (and build a throwaway volume joiner).
+    if isinstance(source, (str, Path)):
+        streaming = False
+    else:
+        peek_target = resolve_source(source).open_source
+        streaming = is_stream(peek_target) and not is_seekable(peek_target)
 
     with open_archive(
         source,
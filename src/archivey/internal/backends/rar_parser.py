@@ -744,29 +744,52 @@ def rar5_hash_key(password: str | bytes, salt: bytes, kdf_count_shift: int) -> b
     """Derive the RAR5 HashKey used by ``ConvertHashToMAC`` (PBKDF2 at ``(1<<kdf)+16``).
 
     The AES key is at ``1 << kdf_count``, HashKey at ``+16``, and PswCheck at ``+32``
-    (UnRAR ``crypt5.cpp``).
+    (UnRAR ``crypt5.cpp``). Those are running XORs of one HMAC chain sampled at three
+    iteration counts, not slices of a longer output: ``pbkdf2_hmac`` exposes only the
+    final sum, so each needs its own call (a larger ``dklen`` yields unrelated blocks).
     """
     if kdf_count_shift > _RAR_MAX_KDF_SHIFT:
         raise CorruptionError(f"RAR5 kdf_count too large: {kdf_count_shift}")
     return _rar5_s2k(password, salt, (1 << kdf_count_shift) + 16)
 
 
-def convert_crc_to_mac(crc: int, hash_key: bytes) -> int:
-    """RAR5 ``ConvertHashToMAC`` for CRC32: XOR-fold of ``HMAC-SHA256(HashKey, crc_le4)``."""
-    digest = hmac.new(
-        hash_key, (crc & 0xFFFFFFFF).to_bytes(4, "little"), hashlib.sha256
-    ).digest()
-    result = 0
-    for (word,) in struct.iter_unpack("<I", digest):
-        result ^= word
-    return result & 0xFFFFFFFF
+def keyed_hmac_sha256(hash_key: bytes) -> hmac.HMAC:
+    """Keyed ``HMAC-SHA256`` with no message, for ``.copy()`` per MAC.
 
+    Every member of an archive shares one HashKey, so a reader keys this once and passes
+    it to the ``convert_*_to_mac`` functions in place of the raw key; the ipad/opad key
+    setup then runs once per archive rather than once per checksum. Callers must copy,
+    never update, it.
+    """
+    return hmac.new(hash_key, digestmod=hashlib.sha256)
+
+
+def _hmac_sha256(hash_key: bytes | hmac.HMAC, message: bytes) -> bytes:
+    if isinstance(hash_key, bytes):
+        return hmac.new(hash_key, message, hashlib.sha256).digest()
+    mac = hash_key.copy()
+    mac.update(message)
+    return mac.digest()
+
+
+def convert_crc_to_mac(crc: int, hash_key: bytes | hmac.HMAC) -> int:
+    """RAR5 ``ConvertHashToMAC`` for CRC32: XOR-fold of ``HMAC-SHA256(HashKey, crc_le4)``.
 
-def convert_blake2sp_to_mac(digest: bytes, hash_key: bytes) -> bytes:
-    """RAR5 ``ConvertHashToMAC`` for BLAKE2sp: ``HMAC-SHA256(HashKey, digest32)``."""
+    ``hash_key`` is the raw HashKey or its :func:`keyed_hmac_sha256` prototype.
+    """
+    digest = _hmac_sha256(hash_key, (crc & 0xFFFFFFFF).to_bytes(4, "little"))
+    w0, w1, w2, w3, w4, w5, w6, w7 = struct.unpack("<8I", digest)
+    return w0 ^ w1 ^ w2 ^ w3 ^ w4 ^ w5 ^ w6 ^ w7
+
+
+def convert_blake2sp_to_mac(digest: bytes, hash_key: bytes | hmac.HMAC) -> bytes:
+    """RAR5 ``ConvertHashToMAC`` for BLAKE2sp: ``HMAC-SHA256(HashKey, digest32)``.
+
+    ``hash_key`` is the raw HashKey or its :func:`keyed_hmac_sha256` prototype.
+    """
     if len(digest) != 32:
         raise ValueError(f"BLAKE2sp digest must be 32 bytes, got {len(digest)}")
-    return hmac.new(hash_key, digest, hashlib.sha256).digest()
+    return _hmac_sha256(hash_key, digest)
 
 
 # ---------------------------------------------------------------------------
@@ -1552,10 +1575,10 @@ def _check_rar5_password(
         return False
     kdf_count = (1 << kdf_count_shift) + 32
     pwd_hash = _rar5_s2k(password, salt, kdf_count)
-    pwd_check = bytearray(8)
-    for i, v in enumerate(pwd_hash):
-        pwd_check[i & 7] ^= v
-    if not hmac.compare_digest(bytes(pwd_check), hdr_check):
+    # PswCheck is the 32-byte hash XOR-folded to 8 bytes: four little-endian words.
+    w0, w1, w2, w3 = struct.unpack("<4Q", pwd_hash)
+    pwd_check = (w0 ^ w1 ^ w2 ^ w3).to_bytes(8, "little")
+    if not hmac.compare_digest(pwd_check, hdr_check):
         raise EncryptionError("Wrong password for RAR5 header encryption")
     return True
 
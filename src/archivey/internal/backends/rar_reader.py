@@ -21,6 +21,7 @@ and RAR5 ConvertHashToMAC when checksums are tweaked.
 
 from __future__ import annotations
 
+import hmac
 import os
 import shutil
 import stat
@@ -28,7 +29,7 @@ import subprocess
 import tempfile
 from collections.abc import Callable, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 
 from archivey.config import ArchiveyConfig
 from archivey.cost import AccessCost, CostReceipt, ListingCost, StreamCapability
@@ -49,6 +50,7 @@ from archivey.internal.backends.rar_parser import (
     _check_rar5_password,
     convert_blake2sp_to_mac,
     convert_crc_to_mac,
+    keyed_hmac_sha256,
     parse_rar_archive,
     parse_rar_volumes,
     rar5_hash_key,
@@ -91,6 +93,9 @@ from archivey.types import (
     crc32_digest,
 )
 
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
 # rarfile / RAR host_os values (parser maps RAR5 Windows→2, Unix→3).
 _RAR_HOST_OS_TO_CREATE_SYSTEM: dict[int, CreateSystem] = {
     0: CreateSystem.FAT,
@@ -165,7 +170,9 @@ def _crc_is_tweaked(info: RarMemberInfo) -> bool:
     return bool(enc.flags & _RAR_ENCDATA_FLAG_TWEAKED_CHECKSUMS)
 
 
-def _member_hashes(info: RarMemberInfo) -> dict[HashAlgorithm, bytes]:
+def _member_hashes(
+    info: RarMemberInfo, tweaked: bool | None = None
+) -> dict[HashAlgorithm, bytes]:
     """Plaintext digests safe for member verification without a HashKey.
 
     When ``RAR5_XENC_TWEAKED`` / ``HASHMAC`` (0x02) is set, the stored CRC32 and
@@ -173,9 +180,13 @@ def _member_hashes(info: RarMemberInfo) -> dict[HashAlgorithm, bytes]:
     plaintext digest. Those values are stashed in ``member.extra`` and verified via
     forward-transform when a password is available (see
     :meth:`RarReader._tweaked_verify_spec`).
+
+    ``tweaked`` is :func:`_crc_is_tweaked` for ``info`` when the caller has already
+    computed it.
     """
     hashes: dict[HashAlgorithm, bytes] = {}
-    tweaked = _crc_is_tweaked(info)
+    if tweaked is None:
+        tweaked = _crc_is_tweaked(info)
     if info.crc32 is not None and not tweaked:
         hashes[HashAlgorithm.CRC32] = crc32_digest(info.crc32)
     if info.blake2sp_hash is not None and not tweaked:
@@ -247,7 +258,8 @@ class _UnrarOwnedStream(DelegatingStream):
         has_verifiable_hash: bool = False,
         encrypted: bool = False,
     ) -> None:
-        # Track bytes via read(); disable readinto passthrough so counting is not skipped.
+        # read() and readinto() are both overridden to track bytes and map the exit code;
+        # passthrough stays off so the read()-based fallback in readinto() still counts.
         super().__init__(stdout, readinto_passthrough=False)
         self._proc = proc
         self._named_member = named_member
@@ -265,6 +277,19 @@ class _UnrarOwnedStream(DelegatingStream):
             self._map_exit_if_reaped(wait_timeout=1.0)
         return data
 
+    def readinto(self, b: "WriteableBuffer", /) -> int:
+        # Same bookkeeping as read(), but straight into the caller's buffer: the solid
+        # demux skips unselected members through here without a bytes per chunk.
+        inner_readinto = getattr(self._inner, "readinto", None)
+        if inner_readinto is None:
+            # Routes through self.read(), which already counts and maps the exit code.
+            return super().readinto(b)
+        n = inner_readinto(b)
+        self._bytes_read += n
+        if not n:
+            self._map_exit_if_reaped(wait_timeout=1.0)
+        return n
+
     def _raise_for_returncode(self, rc: int) -> None:
         """Map an unrar exit code to an archivey error, or return quietly."""
         # RARLAB unrar exit codes: 11 bad password, 3 CRC/corrupt data, 2 fatal
@@ -369,6 +394,10 @@ class RarReader(BaseArchiveReader):
         self._archive_path: Path | None = None
         self._volume_paths: list[Path] = []
         self._live_unrar: subprocess.Popen[bytes] | None = None
+        # Keyed HMAC per (salt, kdf_count, check_value): WinRAR reuses one salt across an
+        # archive's members, and each HashKey derivation is two ~32k-iteration PBKDF2
+        # runs. Scoped to this reader so the secret-keyed state dies with it.
+        self._hash_macs: dict[tuple[bytes, int, bytes | None], hmac.HMAC | None] = {}
 
         if is_stream(source) and not is_seekable(source):
             raise StreamNotSeekableError(
@@ -383,6 +412,9 @@ class RarReader(BaseArchiveReader):
         if self._archive.is_volume or self._volume_count > 1:
             self._volume_count = max(self._volume_count, len(self._volume_paths) or 1)
         self._members = [self._to_member(info) for info in self._archive.members]
+        # ``info`` / ``cost`` rebuild ArchiveInfo on every access; the member list is
+        # fixed after the parse, so scan it for encryption once here.
+        self._any_member_encrypted = any(m.is_encrypted for m in self._archive.members)
 
     def _open_shared_source(self, source: Path | BinaryIO) -> SharedSource:
         """Build SharedSource, discovering/materializing volumes as needed."""
@@ -604,7 +636,7 @@ class RarReader(BaseArchiveReader):
             is_current=not version_history,
             create_system=create_system,
             windows_attrs=windows_attrs,
-            hashes=_member_hashes(info),
+            hashes=_member_hashes(info, tweaked),
             link_target=link_target,
             extra=extra,
             _raw=info,
@@ -692,7 +724,9 @@ class RarReader(BaseArchiveReader):
                 owned: BinaryIO = self._track_decompressed(
                     _UnrarOwnedStream(stdout, proc, has_verifiable_hash=True)
                 )
-                solid = SolidBlockReader(owned)
+                # _UnrarOwnedStream.readinto fills straight from the pipe, so gap skips
+                # can reuse one scratch buffer instead of a bytes per chunk.
+                solid = SolidBlockReader(owned, skip_readinto=True)
             return solid
 
         pipe_offset = 0
@@ -765,19 +799,25 @@ class RarReader(BaseArchiveReader):
         enc = info.file_encryption
         if password is None or enc is None:
             return None
-        hash_key = _tweaked_hash_key(enc, password)
-        if hash_key is None:
+        context = (enc.salt, enc.kdf_count, enc.check_value)
+        if context in self._hash_macs:
+            hash_mac = self._hash_macs[context]
+        else:
+            hash_key = _tweaked_hash_key(enc, password)
+            hash_mac = keyed_hmac_sha256(hash_key) if hash_key is not None else None
+            self._hash_macs[context] = hash_mac
+        if hash_mac is None:
             return None
         expected: dict[HashAlgorithm, bytes] = {}
         transforms: dict[HashAlgorithm, Callable[[bytes], bytes]] = {}
         if info.crc32 is not None:
             expected[HashAlgorithm.CRC32] = crc32_digest(info.crc32)
-            transforms[HashAlgorithm.CRC32] = lambda digest, hk=hash_key: (
+            transforms[HashAlgorithm.CRC32] = lambda digest, hk=hash_mac: (
                 convert_crc_to_mac(int.from_bytes(digest, "big"), hk).to_bytes(4, "big")
             )
         if info.blake2sp_hash is not None:
             expected[HashAlgorithm.BLAKE2SP] = info.blake2sp_hash
-            transforms[HashAlgorithm.BLAKE2SP] = lambda digest, hk=hash_key: (
+            transforms[HashAlgorithm.BLAKE2SP] = lambda digest, hk=hash_mac: (
                 convert_blake2sp_to_mac(digest, hk)
             )
         if not expected:
@@ -920,7 +960,6 @@ class RarReader(BaseArchiveReader):
             # RAR solid is one continuous compression context; block count is unknown.
             solid_block_count=None,
         )
-        any_encrypted = any(m.is_encrypted for m in self._archive.members)
         is_multivolume = (
             self._archive.is_volume
             or self._volume_count > 1
@@ -932,7 +971,8 @@ class RarReader(BaseArchiveReader):
             is_solid=is_solid,
             member_count=len(self._members),
             comment=self._archive.comment,
-            is_encrypted=self._archive.has_header_encryption or any_encrypted,
+            is_encrypted=self._archive.has_header_encryption
+            or self._any_member_encrypted,
             is_multivolume=is_multivolume,
             cost=cost,
             extra={
@@ -116,17 +116,19 @@ _TAR_EXTENSIONS.update(
 )
 
 
+# TarInfo.type → MemberType, mirroring isdir()/issym()/islnk()/isfile(): the regular
+# types are tarfile.REGULAR_TYPES (incl. contiguous and GNU sparse files).
+_MEMBER_TYPE_BY_TARTYPE: dict[bytes, MemberType] = {
+    tarfile.DIRTYPE: MemberType.DIRECTORY,
+    tarfile.SYMTYPE: MemberType.SYMLINK,
+    tarfile.LNKTYPE: MemberType.HARDLINK,
+    **dict.fromkeys(tarfile.REGULAR_TYPES, MemberType.FILE),
+}
+
+
 def _member_type(info: tarfile.TarInfo) -> MemberType:
-    if info.isdir():
-        return MemberType.DIRECTORY
-    if info.issym():
-        return MemberType.SYMLINK
-    if info.islnk():
-        return MemberType.HARDLINK
-    if info.isfile():
-        return MemberType.FILE
-    # Character/block devices, FIFOs, contiguous files, GNU long-name placeholders, …
-    return MemberType.OTHER
+    # Character/block devices, FIFOs, GNU long-name placeholders, … → OTHER.
+    return _MEMBER_TYPE_BY_TARTYPE.get(info.type, MemberType.OTHER)
 
 
 # Shared across FILE/HARDLINK members — avoid per-member CompressionMethod construction.
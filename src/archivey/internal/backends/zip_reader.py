@@ -143,6 +143,11 @@ _ZIP_COMPRESSION_TUPLES: dict[int, tuple[CompressionMethod, ...]] = {
     method_id: (CompressionMethod(algo=algo),)
     for method_id, algo in _ZIP_COMPRESSION_ALGOS.items()
 }
+# Fallback for unrecognised method ids, shared too: a ``.get`` default is evaluated on
+# every call, so an inline literal would still build one per member.
+_ZIP_UNKNOWN_COMPRESSION: tuple[CompressionMethod, ...] = (
+    CompressionMethod(algo=CompressionAlgorithm.UNKNOWN),
+)
 
 # ZIP method id -> shared codec-layer Codec for unencrypted member decode.
 _ZIP_METHOD_CODECS: dict[int, Codec] = {
@@ -284,13 +289,14 @@ def _zip_timestamps(
     if not extra:
         return modified, accessed, created, issues
     pos = 0
-    while pos + 4 <= len(extra):
-        tag, length = struct.unpack("<HH", extra[pos : pos + 4])
-        field = extra[pos + 4 : pos + 4 + length]
+    end = len(extra)
+    while pos + 4 <= end:
+        # unpack_from in place; only the two fields we decode are ever sliced out.
+        tag, length = struct.unpack_from("<HH", extra, pos)
         if tag == 0x000A and ntfs_field is None:
-            ntfs_field = field
-        elif tag == 0x5455 and field and ut_field is None:
-            ut_field = field
+            ntfs_field = extra[pos + 4 : pos + 4 + length]
+        elif tag == 0x5455 and length and pos + 4 < end and ut_field is None:
+            ut_field = extra[pos + 4 : pos + 4 + length]
         pos += 4 + length
 
     if ntfs_field is not None:
@@ -332,9 +338,7 @@ def _zip_timestamps(
         cursor = 1
         for bit, ut_name in ((0x01, "mtime"), (0x02, "atime"), (0x04, "ctime")):
             if flags & bit and cursor + 4 <= len(ut_field):
-                ts = int.from_bytes(
-                    ut_field[cursor : cursor + 4], "little", signed=True
-                )
+                (ts,) = struct.unpack_from("<i", ut_field, cursor)
                 cursor += 4
                 try:
                     when = datetime.fromtimestamp(ts, tz=timezone.utc)
@@ -620,14 +624,12 @@ class ZipReader(BaseArchiveReader):
         )
         if aes_info is not None:
             # Method 99 is a wrapper; surface the underlying compression algorithm.
-            algo = _ZIP_COMPRESSION_ALGOS.get(
-                aes_info.actual_method, CompressionAlgorithm.UNKNOWN
+            compression = _ZIP_COMPRESSION_TUPLES.get(
+                aes_info.actual_method, _ZIP_UNKNOWN_COMPRESSION
             )
-            compression: tuple[CompressionMethod, ...] = (CompressionMethod(algo=algo),)
         else:
             compression = _ZIP_COMPRESSION_TUPLES.get(
-                info.compress_type,
-                (CompressionMethod(algo=CompressionAlgorithm.UNKNOWN),),
+                info.compress_type, _ZIP_UNKNOWN_COMPRESSION
             )
 
         modified, accessed, created, ts_issues = _zip_timestamps(info)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import threading
 import uuid
 import weakref
@@ -106,6 +107,12 @@ def _apply_last_entry_wins_is_current(members: list[ArchiveMember]) -> None:
             seen.add(member.name)
 
 
+def _member_id_key(member: ArchiveMember) -> int:
+    """Bisect key over a same-name list; an unstamped member sorts first."""
+    member_id = member._member_id
+    return -1 if member_id is None else member_id
+
+
 @dataclass(frozen=True)
 class _Materialized:
     """Published member materialization plus its private lookup index."""
@@ -560,6 +567,10 @@ class BaseArchiveReader(ArchiveReader):
         already returns an ``ArchiveStream``; nesting is collapsed inside
         :meth:`ArchiveStream._ensure_open` so the public handle is a **single**
         wrapper. Deferral does not change what a failed open raises — only when.
+
+        Each call builds a fresh wrapper on purpose: a caller may hold a yielded stream
+        past the iterator's advance (it must then read as closed), so recycling wrappers
+        from a pool would let an old reference observe the next member's data.
         """
         return self._register_public_stream(
             self._wrap_member_stream(
@@ -815,15 +826,20 @@ class BaseArchiveReader(ArchiveReader):
         """
         if is_current_first:
             _apply_last_entry_wins_is_current(members)
-            if not any(member.is_link for member in members):
-                return
+        # Collected once: both phases below (and the no-links early exit) walk only the
+        # links, not the whole listing. Resolution runs after the complete name index
+        # exists, so a link listed before its target still resolves on the first try.
+        links = [member for member in members if member.is_link]
+        if not links:
+            if not is_current_first:
+                _apply_last_entry_wins_is_current(members)
+            return
 
         def _resolve() -> None:
-            for member in members:
-                if member.is_link:
-                    self._ensure_link_target(member)
-            for member in members:
-                if member.is_link and member.link_target:
+            for member in links:
+                self._ensure_link_target(member)
+            for member in links:
+                if member.link_target:
                     self._resolve_link(member, by_name_lists)
 
         try:
@@ -931,12 +947,23 @@ class BaseArchiveReader(ArchiveReader):
         self, *, enforce_listing_limits: bool = True
     ) -> list[ArchiveMember]:
         """Return the complete member list, raising on incomplete reports."""
+        return list(
+            self._ensure_members_registered(
+                enforce_listing_limits=enforce_listing_limits
+            ).members
+        )
+
+    def _ensure_members_registered(
+        self, *, enforce_listing_limits: bool = True
+    ) -> MemberListReport:
+        """Materialize (or reuse) the complete report without copying its member tuple,
+        raising on incomplete reports."""
         report = self._materialize_members(
             enforce_listing_limits=enforce_listing_limits
         ).report
         if report.error is not None:
             raise report.error
-        return list(report.members)
+        return report
 
     def _get_members_index_only(self) -> list[ArchiveMember]:
         """Index-only member list: stamp ids, no link resolution, no member-data reads."""
@@ -959,7 +986,11 @@ class BaseArchiveReader(ArchiveReader):
         *,
         enforce_listing_limits: bool = False,
     ) -> None:
-        """Assign identity and run backend-independent presentation checks once."""
+        """Assign identity and run backend-independent presentation checks once.
+
+        ``idx`` is the member's listing position, so ids need no shared counter or
+        lock: the single materializing (or forward-pass) thread stamps them in order.
+        """
         if member._member_id is not None:
             # Already stamped (e.g. by ``_get_members_index_only``). Still re-account
             # after a tracker ``reset()`` so totals match the member list — otherwise
@@ -980,7 +1011,21 @@ class BaseArchiveReader(ArchiveReader):
     def _index_member_name(
         by_name_lists: dict[str, list[ArchiveMember]], member: ArchiveMember
     ) -> None:
-        by_name_lists.setdefault(member.name, []).append(member)
+        """Append ``member`` to its same-name list.
+
+        Callers index each member right after ``_register_member`` stamps its id, in
+        listing order, so every list stays sorted by ``_member_id`` with no re-sort;
+        positional lookups (:meth:`_latest_prior_named_member`) rely on that. No
+        membership check either: each member is indexed exactly once.
+        """
+        # get-then-insert rather than setdefault(name, []), which builds a throwaway
+        # empty list for every repeated name, and creates the new list pre-filled.
+        name = member.name
+        same_name = by_name_lists.get(name)
+        if same_name is None:
+            by_name_lists[name] = [member]
+        else:
+            same_name.append(member)
 
     @staticmethod
     def _target_name_keys(target_name: str) -> tuple[str, ...]:
@@ -998,15 +1043,24 @@ class BaseArchiveReader(ArchiveReader):
         best: ArchiveMember | None = None
         best_id = -1
         for name in BaseArchiveReader._target_name_keys(target_name):
-            for prior in reversed(by_name_lists.get(name, [])):
-                prior_id = prior._member_id
-                if prior_id is None:
-                    continue
-                if prior_id < before_id:
-                    if prior_id > best_id:
-                        best = prior
-                        best_id = prior_id
-                    break
+            candidates = by_name_lists.get(name)
+            if not candidates:
+                continue
+            # Same-name lists are sorted by id (see _index_member_name): the common
+            # case is the newest entry, else bisect instead of a reverse linear walk
+            # (quadratic over a run of same-named hardlinks).
+            last_id = candidates[-1]._member_id
+            if last_id is not None and last_id < before_id:
+                pos = len(candidates)
+            else:
+                pos = bisect.bisect_left(candidates, before_id, key=_member_id_key)
+            if pos == 0:
+                continue
+            prior = candidates[pos - 1]
+            prior_id = prior._member_id
+            if prior_id is not None and best_id < prior_id < before_id:
+                best = prior
+                best_id = prior_id
         return best
 
     @staticmethod
@@ -1567,6 +1621,8 @@ class BaseArchiveReader(ArchiveReader):
         token = self._state.acquire_pass("stream_members")
         current: ArchiveStream | None = None
         try:
+            # ``None`` (select everything) stays ``None``: the per-member test below is
+            # a single identity check, with no predicate call on the default path.
             selector = normalize_member_selector(members)
             if self._streaming:
                 self._enter_forward_pass("stream_members()")
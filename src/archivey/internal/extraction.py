@@ -22,7 +22,6 @@ from __future__ import annotations
 
 import contextlib
 import errno
-import logging
 import os
 import shutil
 import stat
@@ -65,14 +64,13 @@ from archivey.internal.filters import (
     check_universal,
     collision_key,
 )
+from archivey.internal.logs import extraction as logger
 from archivey.internal.selection import normalize_member_selector
 from archivey.types import ArchiveMember, MemberType
 
 if TYPE_CHECKING:
     from archivey.internal.base_reader import BaseArchiveReader
 
-logger = logging.getLogger("archivey.extraction")
-
 _CHUNK = 1024 * 1024  # 1 MiB copy chunk
 
 # Prefix of the temp files atomic FILE writes stage in the destination directory
@@ -256,6 +254,8 @@ class ExtractionCoordinator:
         limits: ExtractionLimits | None = None,
     ) -> None:
         self._policy = policy
+        # Resolved once per coordinator rather than per member in ``_transform``.
+        self._policy_transform = POLICY_TRANSFORMS[policy]
         self._overwrite = overwrite
         self._on_error = on_error
         self._on_progress = on_progress
@@ -291,12 +291,21 @@ class ExtractionCoordinator:
 
         selector = normalize_member_selector(self._members)
 
+        # Extract-prep materialization: enforce ListingLimits before writing.
+        # Scan-required backends (TAR, directory) would otherwise walk via unguarded
+        # stream_members() and never hit listing caps. Done before the totals peek below,
+        # so that peek is served from this cached report instead of re-listing an
+        # upfront index, and nothing copies the member list just to discard it.
+        if not forward_only:
+            reader._ensure_members_registered(enforce_listing_limits=True)
+
         # Progress totals cover what this call will actually attempt: when a member list
-        # is free (an upfront index) and a selector is given, totals count only the
-        # selected members — so members_done can reach members_total and the byte
-        # estimate matches the selected output. The user `filter` runs only during
-        # extraction and cannot be pre-applied, so members it skips still count as
-        # processed below. Streaming readers with no free list report None totals.
+        # is free (an upfront index or the materialized list) and a selector is given,
+        # totals count only the selected members — so members_done can reach
+        # members_total and the byte estimate matches the selected output. The user
+        # `filter` runs only during extraction and cannot be pre-applied, so members it
+        # skips still count as processed below. Streaming readers with no free list
+        # report None totals.
         members_report = reader.members_report_if_available()
         all_members = list(members_report) if members_report is not None else None
         if all_members is not None and selector is not None:
@@ -304,13 +313,6 @@ class ExtractionCoordinator:
         members_total = len(all_members) if all_members is not None else None
         total_estimate = self._estimate_total_bytes(all_members)
 
-        # Extract-prep materialization: enforce ListingLimits before writing.
-        # Indexed backends may already have been peeked via members_report_if_available();
-        # scan-required backends (TAR, directory) would otherwise walk via unguarded
-        # stream_members() and never hit listing caps.
-        if not forward_only:
-            reader._get_members_registered(enforce_listing_limits=True)
-
         # The pass is driven through the public stream_members(), which applies the
         # selection (skipped members never surface here — they are invisible to progress
         # and results, matching the totals above). When the totals pre-filtered the free
@@ -529,7 +531,7 @@ class ExtractionCoordinator:
         transient copy. Returns the copy to write, or ``None`` if the user filter skipped
         the member. Raises a ``FilterRejectionError`` on a universal violation."""
         check_universal(original, dest_root)
-        transformed = POLICY_TRANSFORMS[self._policy](original)
+        transformed = self._policy_transform(original)
         if self._filter is not None:
             transformed = self._filter(transformed)
             if transformed is None:
@@ -1302,6 +1304,11 @@ class ExtractionCoordinator:
             raise ExtractionError(
                 "FILE member has no data stream to extract (backend returned stream=None)"
             )
+        # Plain read() rather than readinto() on a reused buffer: ArchiveStream.readinto
+        # is read() plus a copy (full-count coalescing and fused verification live in
+        # read()), and every decoder hands back fresh bytes anyway, so a pooled buffer
+        # would add a memcpy per chunk without saving an allocation. The fixed 1 MiB
+        # request already gives large sequential writes.
         while True:
             chunk = stream.read(_CHUNK)
             if not chunk:
@@ -10,6 +10,7 @@ archive-namespace name it refers to (see ``archive-reading``: link following).
 
 from __future__ import annotations
 
+import functools
 import os
 import posixpath
 import re
@@ -200,6 +201,27 @@ def emit_member_name_normalized(
     )
 
 
+# Link resolution normalizes the same joined paths repeatedly: every hardlink to one
+# file carries the same stored target, and each hop of a symlink chain is resolved
+# again for every link that passes through it. Bounded so a hostile listing cannot
+# grow it without limit.
+_normpath = functools.lru_cache(maxsize=4096)(posixpath.normpath)
+
+
+def _is_normalized_relpath(path: str) -> bool:
+    """True when ``posixpath.normpath(path)`` would return ``path`` unchanged and it is
+    relative — the common stored link target, which then needs no normalization."""
+    return (
+        bool(path)
+        and path != "."
+        and not path.startswith(("/", "./"))
+        and not path.endswith(("/", "/."))
+        and "//" not in path
+        and "/./" not in path
+        and ".." not in path
+    )
+
+
 def resolve_link_target_name(
     link_name: str, target: str, member_type: MemberType
 ) -> str | None:
@@ -235,7 +257,7 @@ def resolve_link_target_name(
         joined = posixpath.join(base_dir, target)
     else:
         joined = target
-    resolved = posixpath.normpath(joined)
+    resolved = joined if _is_normalized_relpath(joined) else _normpath(joined)
     if resolved in (".", "/") or resolved.startswith(("../", "/")) or resolved == "..":
         return None  # escapes the archive root (or names the root itself)
     return resolved
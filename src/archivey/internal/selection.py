@@ -29,11 +29,29 @@ def normalize_member_selector(
         else:
             names.add(entry)
 
+    # Frozen once and specialized: the predicate runs for every member of every pass,
+    # and the common selections are names-only or members-only. Bound ``__contains__``
+    # keeps each call to one attribute load per field read. Unstamped members need no
+    # explicit check: ``identities`` never holds a ``None`` id, so they cannot match.
+    has_name = frozenset(names).__contains__
+    has_identity = frozenset(identities).__contains__
+
+    if not identities:
+
+        def by_name(member: ArchiveMember) -> bool:
+            return has_name(member.name)
+
+        return by_name
+    if not names:
+
+        def by_identity(member: ArchiveMember) -> bool:
+            return has_identity((member._archive_id, member._member_id))
+
+        return by_identity
+
     def predicate(member: ArchiveMember) -> bool:
-        if member.name in names:
-            return True
-        if member._archive_id is not None and member._member_id is not None:
-            return (member._archive_id, member._member_id) in identities
-        return False
+        return has_name(member.name) or has_identity(
+            (member._archive_id, member._member_id)
+        )
 
     return predicate
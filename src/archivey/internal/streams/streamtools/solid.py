@@ -27,16 +27,31 @@ from archivey.internal.streams.streamtools.base import ReadOnlyIOStream
 _SKIP_CHUNK = 1 << 20  # 1 MiB
 
 
-def skip_forward(stream: BinaryIO, count: int) -> None:
+def skip_forward(stream: BinaryIO, count: int, *, use_readinto: bool = False) -> None:
     """Read and discard exactly ``count`` bytes from a forward-only ``stream``.
 
     Raises :class:`EOFError` if the stream ends before ``count`` bytes are consumed.
+    ``use_readinto=True`` lands the skipped bytes in one reused scratch buffer instead of
+    a fresh ``bytes`` per chunk. Only opt in when ``stream.readinto`` is native (fills the
+    buffer directly, e.g. from a pipe): a ``read()``-backed ``readinto`` would add a copy
+    per chunk. Without ``readinto`` it falls back to ``read()``.
     """
+    readinto = getattr(stream, "readinto", None) if use_readinto else None
+    if readinto is None:
+        while count > 0:
+            chunk = stream.read(min(count, _SKIP_CHUNK))
+            if not chunk:
+                raise EOFError("stream ended before the requested position")
+            count -= len(chunk)
+        return
+    if count <= 0:
+        return
+    scratch = memoryview(bytearray(min(count, _SKIP_CHUNK)))
     while count > 0:
-        chunk = stream.read(min(count, _SKIP_CHUNK))
-        if not chunk:
+        n = readinto(scratch[: min(count, len(scratch))])
+        if not n:
             raise EOFError("stream ended before the requested position")
-        count -= len(chunk)
+        count -= n
 
 
 class _MemberSlice(ReadOnlyIOStream):
@@ -81,7 +96,11 @@ class _MemberSlice(ReadOnlyIOStream):
             )
         # Finalize any prior active member and jump the gap (same as eager open_member).
         reader._current = None
-        skip_forward(reader._block, self._offset - reader._pos)
+        skip_forward(
+            reader._block,
+            self._offset - reader._pos,
+            use_readinto=reader._skip_readinto,
+        )
         reader._pos = self._offset
         reader._current = self
         self._pending = False
@@ -125,9 +144,13 @@ class SolidBlockReader:
     :class:`_MemberSlice` type — no extra wrapper layer.
     """
 
-    def __init__(self, block: BinaryIO, *, close_block: bool = True) -> None:
+    def __init__(
+        self, block: BinaryIO, *, close_block: bool = True, skip_readinto: bool = False
+    ) -> None:
         self._block = block
         self._close_block = close_block
+        # Forwarded to skip_forward(use_readinto=...): only for a native-readinto block.
+        self._skip_readinto = skip_readinto
         self._pos = 0  # bytes consumed from the block so far
         self._current: _MemberSlice | None = None
         self._closed = False
@@ -145,7 +168,7 @@ class SolidBlockReader:
         # Finalize the previous member and jump the gap in one forward skip. This is where
         # a prior member's unread tail is actually consumed (lazy drain).
         self._current = None
-        skip_forward(self._block, offset - self._pos)
+        skip_forward(self._block, offset - self._pos, use_readinto=self._skip_readinto)
         self._pos = offset
         slice_ = _MemberSlice(self, offset, size, pending=False)
         self._current = slice_
@@ -11,6 +11,7 @@ F5 — ``hmac.compare_digest`` for RAR5 PswCheck.
 from __future__ import annotations
 
 import hashlib
+import hmac
 import io
 import zlib
 from pathlib import Path
@@ -30,6 +31,7 @@ from archivey.internal.backends.rar_parser import (
     _check_rar5_password,
     convert_blake2sp_to_mac,
     convert_crc_to_mac,
+    keyed_hmac_sha256,
     parse_rar_archive,
     rar5_hash_key,
 )
@@ -148,6 +150,12 @@ def test_f1_convert_hash_to_mac_crc_and_blake2sp_roundtrip() -> None:
     # Forward transform is deterministic; re-applying with the same key matches.
     assert convert_crc_to_mac(real_crc, hash_key) == tweaked_crc
     assert convert_blake2sp_to_mac(real_blake, hash_key) == tweaked_blake
+    assert tweaked_blake == hmac.new(hash_key, real_blake, hashlib.sha256).digest()
+    # A reader's keyed-HMAC prototype gives the same MACs, and survives reuse.
+    prototype = keyed_hmac_sha256(hash_key)
+    for _ in range(2):
+        assert convert_crc_to_mac(real_crc, prototype) == tweaked_crc
+        assert convert_blake2sp_to_mac(real_blake, prototype) == tweaked_blake
 
     # VerifyingStream with transforms accepts good data and rejects a wrong MAC.
     transforms = {
@@ -214,6 +222,29 @@ def test_f1_convert_hash_to_mac_matches_fixture_stored_digest(
         assert convert_blake2sp_to_mac(hasher.digest(), hash_key) == info.blake2sp_hash
 
 
+def test_f1_tweaked_hash_key_derived_once_per_salt(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Members sharing a salt/kdf reuse one HashKey instead of re-running PBKDF2."""
+    from archivey.internal.backends import rar_reader
+
+    calls: list[bytes] = []
+    derive = rar_reader._tweaked_hash_key
+
+    def counting(enc: RarEncryptionInfo, password: str) -> bytes | None:
+        calls.append(enc.salt)
+        return derive(enc, password)
+
+    monkeypatch.setattr(rar_reader, "_tweaked_hash_key", counting)
+    with open_archive(_rar_fixture("encryption__.rar"), password="password") as reader:
+        infos = [m._raw for m in reader.members() if m.is_file]
+        assert len(infos) == 2
+        for info in infos * 2:
+            assert isinstance(info, RarMemberInfo)
+            assert reader._tweaked_verify_spec(info) is not None  # type: ignore[attr-defined]
+    assert len(calls) == 1
+
+
 @requires_binary("unrar")
 def test_f1_encryption_fixture_stashes_tweaked_crc_and_reads() -> None:
     path = _rar_fixture("encryption__.rar")
@@ -842,6 +842,29 @@ def test_progress_totals_respect_selector(tmp_path: Path) -> None:
     assert last.total_bytes_estimated == 6  # a.txt (4) + c.txt (2); b.txt excluded
 
 
+def test_progress_totals_for_random_access_tar(tmp_path: Path) -> None:
+    # TAR has no upfront index, but random-access extraction materializes the listing
+    # (enforcing ListingLimits) before the totals peek, so totals are known from the
+    # first report instead of None, and members_done reaches members_total.
+    src = tmp_path / "a.tar"
+    with tarfile.open(src, "w") as t:
+        d = tarfile.TarInfo("dir")
+        d.type = tarfile.DIRTYPE
+        t.addfile(d)
+        for name, data in [("dir/a.txt", b"aaaa"), ("b.txt", b"bb")]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            t.addfile(info, io.BytesIO(data))
+    dest = tmp_path / "out"
+    progress = []
+    with open_archive(src) as r:
+        r.extract_all(dest, on_progress=progress.append)
+    assert progress
+    assert all(p.members_total == 3 for p in progress)
+    assert progress[-1].members_done == 3
+    assert progress[-1].total_bytes_estimated == 6
+
+
 def test_progress_counts_filter_skipped_members_as_done(tmp_path: Path) -> None:
     # A user-filter skip is still a processed member: members_done must reach
     # members_total at the end (the filter cannot be pre-applied to the totals).
@@ -140,6 +140,21 @@ def test_link_target_backslash_is_literal() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "target",
+    ["a", "a/b", "a..b/c", "a/", "./a", "a/./b", "a//b", "a/.", "a/../b", "..a/b"],
+)
+def test_link_target_fast_path_matches_normpath(target: str) -> None:
+    """Regression: the already-normalized fast path agrees with ``posixpath.normpath``."""
+    import posixpath
+
+    from archivey.internal.naming import resolve_link_target_name
+
+    assert resolve_link_target_name(
+        "link", target, MemberType.HARDLINK
+    ) == posixpath.normpath(target)
+
+
 def test_infer_member_name_from_archive() -> None:
     import re
 
@@ -85,12 +85,15 @@ def test_public_symbols_are_in_all() -> None:
         "WriteError",
     }
 
+    # Exports are lazy (PEP 562): resolve them all so vars() holds every export, then
+    # scan the real namespace — so a stray helper import (not just a missing export)
+    # still shows up. The lazy machinery itself is underscore-private.
+    for name in archivey._EXPORT_MODULE:
+        getattr(archivey, name)
     public = {
         name
         for name, obj in vars(archivey).items()
-        if not name.startswith("_")
-        and not inspect.ismodule(obj)
-        and name not in ("annotations",)
+        if not name.startswith("_") and not inspect.ismodule(obj)
     }
     not_listed = public - set(archivey.__all__) - demoted_but_importable
     assert not not_listed, f"public symbols missing from __all__: {sorted(not_listed)}"
@@ -99,3 +102,37 @@ def test_public_symbols_are_in_all() -> None:
     assert not missing_demoted, (
         f"demoted symbols no longer importable from archivey: {sorted(missing_demoted)}"
     )
+
+
+def test_dir_lists_every_lazy_export() -> None:
+    """``dir(archivey)`` round-trips: its public names are exactly the lazy exports,
+    each resolves, and it covers ``__all__``."""
+    listed = {name for name in dir(archivey) if not name.startswith("__")}
+    assert listed == set(archivey._EXPORT_MODULE)
+    assert set(archivey.__all__) <= set(dir(archivey))
+    for name in listed:
+        assert getattr(archivey, name) is not None
+
+
+def test_bare_import_registers_backends_and_defers_exports() -> None:
+    """``import archivey`` registers every backend (backend-registry spec) while the
+    public names are still bound only on first use."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, archivey\n"
+        "assert 'archivey.internal.backends' in sys.modules\n"
+        "from archivey.internal.registry import get_registry\n"
+        "from archivey.types import ArchiveFormat\n"
+        "assert ArchiveFormat.ZIP in get_registry().list_supported_formats()\n"
+        "assert 'open_archive' not in vars(archivey)\n"
+        "assert archivey.open_archive is sys.modules['archivey.core'].open_archive\n"
+        "assert 'open_archive' in vars(archivey)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no_such_name"):
+        archivey.no_such_name  # noqa: B018
@@ -925,6 +925,40 @@ def test_unrar_owned_stream_encrypted_empty_maps_to_encryption_error_on_read(
     stream.close()  # already mapped on read — must not raise again
 
 
+class _ReadOnlyPipe:
+    """A stdout stand-in exposing only ``read`` (no ``readinto``)."""
+
+    def __init__(self, data: bytes) -> None:
+        self._inner = io.BytesIO(data)
+
+    def read(self, n: int = -1) -> bytes:
+        return self._inner.read(n)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+@pytest.mark.parametrize("pipe", [io.BytesIO, _ReadOnlyPipe])
+def test_unrar_owned_stream_readinto_counts_and_maps_exit(pipe: type) -> None:
+    """readinto (the solid skip path) counts bytes and maps the exit at EOF like read,
+    with or without an inner readinto."""
+    from archivey.internal.backends.rar_reader import _UnrarOwnedStream
+
+    stream = _UnrarOwnedStream(
+        pipe(b"abcd"),
+        _FakeUnrarProc(3),  # type: ignore[arg-type]
+        named_member=True,
+        encrypted=True,
+    )
+    buf = bytearray(8)
+    assert stream.readinto(buf) == 4
+    assert bytes(buf[:4]) == b"abcd"
+    # Bytes were delivered, so exit 3 is corruption rather than a wrong password.
+    with pytest.raises(CorruptionError, match="fatal or CRC"):
+        stream.readinto(buf)
+    stream.close()
+
+
 @pytest.mark.parametrize("rc", [2, 3])
 def test_unrar_owned_stream_encrypted_empty_maps_to_encryption_error_on_close(
     rc: int,
@@ -27,6 +27,11 @@ class _CountingBlock(io.BytesIO):
         self.bytes_read += len(data)
         return data
 
+    def readinto(self, b: bytearray | memoryview, /) -> int:  # type: ignore[override]
+        n = super().readinto(b)
+        self.bytes_read += n
+        return n
+
     def close(self) -> None:
         self.was_closed = True
         super().close()
@@ -134,3 +139,58 @@ def test_skip_forward_helper_raises_on_short_stream() -> None:
     stream.seek(0)
     with pytest.raises(EOFError):
         skip_forward(stream, 5)
+
+
+class _ReadOnly:
+    def __init__(self, data: bytes) -> None:
+        self._inner = io.BytesIO(data)
+
+    def read(self, n: int = -1, /) -> bytes:
+        return self._inner.read(n)
+
+
+class _MethodLog(io.BytesIO):
+    """A BytesIO recording which read method each call used."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.calls: list[str] = []
+
+    def read(self, n: int | None = -1, /) -> bytes:
+        self.calls.append("read")
+        return super().read(n)
+
+    def readinto(self, b: bytearray | memoryview, /) -> int:  # type: ignore[override]
+        self.calls.append("readinto")
+        return super().readinto(b)
+
+
+def test_skip_forward_uses_read_unless_readinto_opted_in() -> None:
+    # A read()-backed readinto (ArchiveStream, ReadOnlyIOStream) would add a copy per
+    # chunk, so readinto is opt-in for streams where it is native.
+    default = _MethodLog(b"x" * 10 + b"tail")
+    skip_forward(default, 10)
+    assert set(default.calls) == {"read"}
+
+    opted = _MethodLog(b"x" * 10 + b"tail")
+    skip_forward(opted, 10, use_readinto=True)
+    assert set(opted.calls) == {"readinto"}
+    assert opted.read() == b"tail"
+    with pytest.raises(EOFError):
+        skip_forward(opted, 1, use_readinto=True)
+
+
+def test_skip_forward_opt_in_without_readinto_uses_read() -> None:
+    stream = _ReadOnly(b"x" * 10 + b"tail")
+    skip_forward(stream, 10, use_readinto=True)  # type: ignore[arg-type]
+    assert stream.read() == b"tail"
+    with pytest.raises(EOFError):
+        skip_forward(stream, 1, use_readinto=True)  # type: ignore[arg-type]
+
+
+def test_solid_reader_skip_readinto_skips_gaps_via_readinto() -> None:
+    block = _MethodLog(b"AAAABBBBBCC")
+    reader = SolidBlockReader(block, skip_readinto=True)
+    block.calls.clear()
+    assert reader.open_member(9, 2).read() == b"CC"
+    assert block.calls[0] == "readinto"  # the 9-byte gap
@@ -30,6 +30,7 @@ from archivey.exceptions import (
     StreamNotSeekableError,
     TruncatedError,
 )
+from archivey.internal.base_reader import BaseArchiveReader
 from tests.conftest import requires_zstd, zstd_backend
 from tests.streams_util import NonSeekableBytesIO
 
@@ -983,6 +984,58 @@ def test_dotdot_symlink_resolves_upward() -> None:
         assert ar.read("dir/up_link") == b"TOP"
 
 
+def _build_symlink_tar(links: list[tuple[str, str]], files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as t:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            t.addfile(info, io.BytesIO(data))
+        for name, target in links:
+            link = tarfile.TarInfo(name)
+            link.type = tarfile.SYMTYPE
+            link.linkname = target
+            t.addfile(link)
+    return buf.getvalue()
+
+
+def test_many_symlink_cycles_resolve_in_linear_lookups() -> None:
+    # Hostile input: thousands of two-link cycles. Each link must be rejected after
+    # walking its own cycle once, not after some fixed hop budget — otherwise listing
+    # cost scales with the budget per link (a cheap denial of service).
+    pairs = 2000
+    links = []
+    for i in range(pairs):
+        links += [(f"a{i}", f"b{i}"), (f"b{i}", f"a{i}")]
+    data = _build_symlink_tar(links, {})
+    lookup = BaseArchiveReader._lookup_link_target_for_member
+    with mock.patch.object(
+        BaseArchiveReader,
+        "_lookup_link_target_for_member",
+        autospec=True,
+        side_effect=lookup,
+    ) as spy:
+        with open_archive(io.BytesIO(data), format=ArchiveFormat.TAR) as ar:
+            members = ar.members()
+            assert all(m.link_target_member is None for m in members)
+            with pytest.raises(ReadError, match="cycle"):
+                ar.read("a0")
+    assert spy.call_count <= 3 * len(links)
+
+
+def test_long_acyclic_symlink_chain_resolves_at_listing_and_read() -> None:
+    # Listing metadata and the open-time follow must agree on a deep (acyclic) chain.
+    depth = 300
+    links = [("l0", "target.txt")]
+    links += [(f"l{i}", f"l{i - 1}") for i in range(1, depth)]
+    data = _build_symlink_tar(links, {"target.txt": b"END"})
+    with open_archive(io.BytesIO(data), format=ArchiveFormat.TAR) as ar:
+        last = ar.get(f"l{depth - 1}")
+        assert last.link_target_member is not None
+        assert last.link_target_member.name == "target.txt"
+        assert ar.read(f"l{depth - 1}") == b"END"
+
+
 def test_absolute_symlink_stays_unresolved() -> None:
     from archivey.exceptions import LinkTargetNotFoundError
 
@@ -1073,6 +1126,18 @@ def test_hardlink_duplicate_name_positional_streaming() -> None:
     assert links["L.txt"].name == "A.txt"
 
 
+def test_hardlink_many_versions_each_link_binds_latest_prior() -> None:
+    entries: list[tuple[str, str, bytes | str]] = []
+    for i in range(5):
+        entries.append(("file", "A.txt", f"v{i}".encode()))
+        entries.append(("hard", f"L{i}.txt", "A.txt"))
+    with open_archive(
+        io.BytesIO(_link_tar_bytes(entries)), format=ArchiveFormat.TAR
+    ) as ar:
+        for i in range(5):
+            assert ar.read(f"L{i}.txt") == f"v{i}".encode()
+
+
 def test_symlink_duplicate_name_last_wins_random_access() -> None:
     data = _link_tar_bytes(
         [